@@ -0,0 +1,102 @@
+// Cold-start benchmark: boots the production server and times until the GPT-4o routes respond.
+// Manual check, run after `npm run build`. Exits non-zero if startup exceeds the budget.
+//
+//   STARTUP_BUDGET_MS=1000 STARTUP_RUNS=3 npm run bench:startup
+
+import { spawn } from "node:child_process";
+import { existsSync } from "node:fs";
+import { createServer } from "node:net";
+import { fileURLToPath } from "node:url";
+import path from "node:path";
+
+const BUDGET_MS = Number(process.env.STARTUP_BUDGET_MS ?? 1000);
+const RUNS = Number(process.env.STARTUP_RUNS ?? 3);
+const TIMEOUT_MS = 30000;
+// Next loads each route module on its first request, so probe the routes whose bundles
+// reach lib/openai. Neither request calls Vapi or OpenAI: the vapi-patient POST only queues
+// the body, and reject fails on the empty body before building a prompt. A top-level
+// `import OpenAI from "openai"` in either route (or autocomplete-patient, which vapi-patient
+// imports) lands inside this measurement.
+const PROBES = [
+  { path: "/api/vapi-patient", body: JSON.stringify({ pid: "startup-probe" }) },
+  { path: "/api/reject", body: "" },
+];
+
+const appDir = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const nextBin = path.join(appDir, "node_modules", "next", "dist", "bin", "next");
+const BUILD_HINT = "run `npm install && npm run build` first";
+
+if (!existsSync(nextBin) || !existsSync(path.join(appDir, ".next", "BUILD_ID"))) {
+  console.error(`No production build found; ${BUILD_HINT}`);
+  process.exit(1);
+}
+
+function freePort() {
+  return new Promise((resolve, reject) => {
+    const srv = createServer();
+    srv.unref();
+    srv.on("error", reject);
+    srv.listen(0, () => {
+      const { port } = srv.address();
+      srv.close(() => resolve(port));
+    });
+  });
+}
+
+async function measureOnce() {
+  const port = await freePort();
+  const started = performance.now();
+  const child = spawn(process.execPath, [nextBin, "start", "-p", String(port)], {
+    cwd: appDir,
+    env: { ...process.env, NODE_ENV: "production" },
+    stdio: "ignore",
+  });
+  // `next start` exits at once without a usable build; don't poll a dead server until the timeout
+  let exited = null;
+  child.on("error", (err) => (exited = err.message));
+  child.on("exit", (code, signal) => (exited = `exited with ${signal ?? `code ${code}`}`));
+
+  try {
+    for (const { path: probePath, body } of PROBES) {
+      for (;;) {
+        if (exited !== null) {
+          throw new Error(`next start ${exited} before ${probePath} responded; ${BUILD_HINT}`);
+        }
+        if (performance.now() - started > TIMEOUT_MS) {
+          throw new Error(`${probePath} did not respond within ${TIMEOUT_MS}ms`);
+        }
+        try {
+          // Any status counts: the point is that the route module has loaded
+          await fetch(`http://127.0.0.1:${port}${probePath}`, { method: "POST", body });
+          break;
+        } catch {
+          await new Promise((r) => setTimeout(r, 10));
+        }
+      }
+    }
+    return performance.now() - started;
+  } finally {
+    child.kill();
+  }
+}
+
+const timings = [];
+for (let i = 0; i < RUNS; i++) {
+  let ms;
+  try {
+    ms = await measureOnce();
+  } catch (err) {
+    console.error(err.message);
+    process.exit(1);
+  }
+  timings.push(ms);
+  console.log(`run ${i + 1}: ${ms.toFixed(0)}ms until the GPT-4o routes respond`);
+}
+
+// Median, so one noisy run doesn't fail the check
+const median = [...timings].sort((a, b) => a - b)[Math.floor(timings.length / 2)];
+console.log(`median: ${median.toFixed(0)}ms (budget ${BUDGET_MS}ms)`);
+if (median > BUDGET_MS) {
+  console.error("Cold start regressed past budget");
+  process.exit(1);
+}
@@ -1,9 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
 import { Patient } from "@/lib/types";
-import OpenAI from "openai";
-
-const OPENAI_API_KEY = process.env.OPENAI_API_KEY ?? "";
-const openai = new OpenAI({ apiKey: OPENAI_API_KEY });
+import { getOpenAI } from "@/lib/openai";
 
 const AUTOCOMPLETE_PROMPT = `You are a clinical data generator for an ER simulation. Given partial patient triage data, generate realistic missing clinical fields.
 
@@ -50,6 +47,7 @@ export async function autocompletePatient(patient: Patient): Promise<Partial<Pat
     .filter(Boolean)
     .join("\n");
 
+  const openai = await getOpenAI();
   const response = await openai.chat.completions.create({
     model: "gpt-4o",
     messages: [
@@ -0,0 +1,11 @@
+// Worker thread for the paperwork PDF route: renders off the server's event loop
+import { parentPort } from "worker_threads";
+import { renderPaperworkPdf } from "@/lib/paperwork-pdf";
+
+parentPort!.on("message", ({ name, papers }: { name: string; papers: Record<string, string> }) => {
+  try {
+    parentPort!.postMessage({ pdf: renderPaperworkPdf(name, papers) });
+  } catch (err) {
+    parentPort!.postMessage({ error: String(err) });
+  }
+});
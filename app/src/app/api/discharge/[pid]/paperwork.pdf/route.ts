@@ -0,0 +1,182 @@
+import { NextRequest, NextResponse } from "next/server";
+import { createHash } from "crypto";
+import { availableParallelism } from "os";
+import { Worker } from "worker_threads";
+import { PAPERWORK_DOCUMENTS } from "@/lib/paperwork-pdf";
+
+const MAX_CACHED_PDFS = 200;
+// Leave a core for the event loop; two workers are plenty for a shift-change batch
+const POOL_SIZE = Math.max(1, Math.min(2, availableParallelism() - 1));
+
+interface RenderJob {
+  name: string;
+  papers: Record<string, string>;
+  resolve: (pdf: string) => void;
+  reject: (err: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  job: RenderJob | null;
+}
+
+// Module-level state (persists across requests in the same server process)
+// Rendered PDFs keyed by paperwork content hash; Map order doubles as LRU order
+const pdfCache = new Map<string, string>();
+const inFlight = new Map<string, Promise<string>>();
+// Bounded like pdfCache, so arbitrary pids can't grow it forever
+const latestKeyByPid = new Map<string, string>();
+// Rendering runs on worker threads so layout never blocks the route's event loop
+const workers: PoolWorker[] = [];
+const pendingJobs: RenderJob[] = [];
+
+type RouteContext = { params: Promise<{ pid: string }> };
+
+function setBounded<V>(map: Map<string, V>, key: string, value: V): void {
+  map.delete(key);
+  map.set(key, value);
+  if (map.size > MAX_CACHED_PDFS) {
+    map.delete(map.keys().next().value!);
+  }
+}
+
+function spawnWorker(): PoolWorker {
+  const slot: PoolWorker = {
+    worker: new Worker(new URL("./render-worker.ts", import.meta.url)),
+    job: null,
+  };
+  slot.worker.on("message", (msg: { pdf?: string; error?: string }) => {
+    const job = slot.job;
+    slot.job = null;
+    if (job) {
+      if (msg.error !== undefined) job.reject(new Error(msg.error));
+      else job.resolve(msg.pdf!);
+    }
+    dispatch();
+  });
+  // A crashed worker fails its current job and is replaced on the next dispatch
+  const retire = (err: Error) => {
+    if (!workers.includes(slot)) return;
+    workers.splice(workers.indexOf(slot), 1);
+    slot.job?.reject(err);
+    slot.job = null;
+    dispatch();
+  };
+  slot.worker.on("error", retire);
+  slot.worker.on("exit", (code) => retire(new Error(`Render worker exited with code ${code}`)));
+  // Attaching listeners re-refs the worker, so unref last: idle workers don't keep the process alive
+  slot.worker.unref();
+  workers.push(slot);
+  return slot;
+}
+
+function dispatch(): void {
+  while (pendingJobs.length > 0) {
+    let slot = workers.find((w) => !w.job);
+    if (!slot && workers.length < POOL_SIZE) slot = spawnWorker();
+    if (!slot) return;
+    const job = pendingJobs.shift()!;
+    slot.job = job;
+    slot.worker.postMessage({ name: job.name, papers: job.papers });
+  }
+}
+
+function renderInPool(name: string, papers: Record<string, string>): Promise<string> {
+  return new Promise((resolve, reject) => {
+    pendingJobs.push({ name, papers, resolve, reject });
+    dispatch();
+  });
+}
+
+// Covers exactly what gets rendered, so identical paperwork shares one cache entry
+function paperworkKey(name: string, papers: Record<string, string>): string {
+  const hash = createHash("sha256").update(name);
+  for (const { key } of PAPERWORK_DOCUMENTS) {
+    hash.update("\0").update(papers[key] ?? "");
+  }
+  return hash.digest("hex");
+}
+
+function isPaperwork(value: unknown): value is Record<string, string> {
+  return (
+    typeof value === "object" && value !== null && !Array.isArray(value) &&
+    Object.values(value).every((v) => typeof v === "string")
+  );
+}
+
+function pdfResponse(pid: string, pdf: string): NextResponse {
+  return new NextResponse(pdf, {
+    headers: {
+      "Content-Type": "application/pdf",
+      "Content-Disposition": `inline; filename="discharge-${pid}.pdf"`,
+      "Cache-Control": "private, no-cache",
+    },
+  });
+}
+
+function getCached(key: string): string | undefined {
+  const pdf = pdfCache.get(key);
+  if (pdf !== undefined) setBounded(pdfCache, key, pdf);
+  return pdf;
+}
+
+function renderCached(key: string, name: string, papers: Record<string, string>): Promise<string> {
+  const cached = getCached(key);
+  if (cached !== undefined) return Promise.resolve(cached);
+  const pending = inFlight.get(key);
+  if (pending) return pending;
+
+  const job = renderInPool(name, papers)
+    .then((pdf) => {
+      setBounded(pdfCache, key, pdf);
+      return pdf;
+    })
+    .finally(() => inFlight.delete(key));
+  inFlight.set(key, job);
+  return job;
+}
+
+// Render (or fetch from cache) the PDF: { name, discharge_papers }
+// Returns the PDF for printing, or 204 with `?prerender=1` (approval just fills the cache)
+export async function POST(req: NextRequest, { params }: RouteContext) {
+  const { pid } = await params;
+  let body: { name?: unknown; discharge_papers?: unknown };
+  try {
+    body = await req.json();
+  } catch {
+    return NextResponse.json({ error: "Invalid JSON body" }, { status: 400 });
+  }
+  const { name, discharge_papers } = body ?? {};
+  if (typeof name !== "string") {
+    return NextResponse.json({ error: "name must be a string" }, { status: 400 });
+  }
+  if (!isPaperwork(discharge_papers)) {
+    return NextResponse.json({ error: "discharge_papers must be an object of strings" }, { status: 400 });
+  }
+
+  try {
+    const key = paperworkKey(name, discharge_papers);
+    const pdf = await renderCached(key, name, discharge_papers);
+    setBounded(latestKeyByPid, pid, key);
+
+    if (req.nextUrl.searchParams.get("prerender") === "1") {
+      return new NextResponse(null, { status: 204 });
+    }
+    return pdfResponse(pid, pdf);
+  } catch (err) {
+    console.error("Paperwork PDF render error:", err);
+    return NextResponse.json({ error: "Render failed" }, { status: 500 });
+  }
+}
+
+// Cache lookup only: the server holds no patient state, so it can't render without a POST
+export async function GET(_req: NextRequest, { params }: RouteContext) {
+  const { pid } = await params;
+  const key = latestKeyByPid.get(pid);
+  const pdf = key ? getCached(key) : undefined;
+  if (pdf === undefined) {
+    return NextResponse.json({ error: "No rendered paperwork for this patient" }, { status: 404 });
+  }
+
+  return pdfResponse(pid, pdf);
+}
@@ -1,7 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
-import OpenAI from "openai";
-
-const openai = new OpenAI({ apiKey: process.env.OPENAI_API_KEY });
+import { getOpenAI } from "@/lib/openai";
 
 export async function POST(req: NextRequest) {
   try {
@@ -60,6 +58,7 @@ Respond in JSON:
 
 If no additional labs are needed based on the doctor's note, return an empty array for additional_labs. Always return at least time_to_discharge.`;
 
+    const openai = await getOpenAI();
     const response = await openai.chat.completions.create({
       model: "gpt-4o",
       messages: [{ role: "user", content: prompt }],
@@ -1,14 +1,11 @@
 import { NextRequest, NextResponse } from "next/server";
 import { Patient } from "@/lib/types";
-import OpenAI from "openai";
+import { getOpenAI, warmOpenAI } from "@/lib/openai";
 import { autocompletePatient } from "../autocomplete-patient/route";
 
 const VAPI_API_KEY = process.env.VAPI_API_KEY ?? "";
-const OPENAI_API_KEY = process.env.OPENAI_API_KEY ?? "";
 const VAPI_ASSISTANT_ID = process.env.VAPI_ASSISTANT_ID ?? "";
 
-const openai = new OpenAI({ apiKey: OPENAI_API_KEY });
-
 // Module-level state (persists across requests in the same server process)
 let lastSeenCallId: string | null = null;
 let initialized = false;
@@ -80,6 +77,7 @@ function extractTranscript(call: VapiCall): string | null {
 }
 
 async function extractPatientData(transcript: string): Promise<Record<string, unknown>> {
+  const openai = await getOpenAI();
   const response = await openai.chat.completions.create({
     model: "gpt-4o",
     messages: [
@@ -127,7 +125,12 @@ async function checkForNewCalls() {
     }
 
     const latest = calls[0];
-    if (latest.id === lastSeenCallId || latest.status !== "ended") return;
+    if (latest.id === lastSeenCallId) return;
+    if (latest.status !== "ended") {
+      // A call is in progress — load the OpenAI SDK now so extraction doesn't wait on it
+      warmOpenAI();
+      return;
+    }
 
     lastSeenCallId = latest.id;
     console.log(`[vapi] New completed call: ${latest.id}`);
@@ -3,6 +3,7 @@
 import { useState, useMemo } from "react";
 import { Patient } from "@/lib/types";
 import * as api from "@/lib/api";
+import { searchRank } from "@/lib/search-index";
 import { usePatientContext } from "@/context/PatientContext";
 import { ElapsedTime } from "@/components/ElapsedTime";
 import { Input } from "@/components/ui/input";
@@ -272,7 +273,7 @@ const COLOR_BORDER: Record<string, string> = {
 };
 
 export default function DoctorPage() {
-  const { patients, updatePatient, dischargePatient, acknowledgeLab, eventLog, simState, appMode } = usePatientContext();
+  const { patients, updatePatient, dischargePatient, acknowledgeLab, eventLog, simState, appMode, searchPatients } = usePatientContext();
   const isBaseline = appMode === "baseline";
 
   const [search, setSearch] = useState("");
@@ -340,23 +341,14 @@ export default function DoctorPage() {
     const erBedPatients = patients.filter(
       (p) => p.status === "er_bed" && !inboxPids.has(p.pid)
     );
-    if (isBaseline) {
-      if (!search.trim()) return erBedPatients;
-      const q = search.toLowerCase();
-      return erBedPatients.filter(
-        (p) => p.name.toLowerCase().includes(q) ||
-          (p.chief_complaint ?? "").toLowerCase().includes(q) ||
-          String(p.bed_number ?? "").includes(q)
-      );
-    }
-    if (!search.trim()) return [];
+    if (!search.trim()) return isBaseline ? erBedPatients : [];
+    // Ranked full-text matches first, then plain bed-number matches
     const q = search.toLowerCase();
-    return erBedPatients.filter(
-      (p) => p.name.toLowerCase().includes(q) ||
-        (p.chief_complaint ?? "").toLowerCase().includes(q) ||
-        String(p.bed_number ?? "").includes(q)
-    );
-  }, [patients, search, inboxItems, isBaseline]);
+    const scores = new Map(searchPatients(search, patients.length).map((r) => [r.pid, r.score]));
+    return erBedPatients
+      .filter((p) => scores.has(p.pid) || String(p.bed_number ?? "").includes(q))
+      .sort((a, b) => searchRank(b, q, scores) - searchRank(a, q, scores));
+  }, [patients, search, inboxItems, isBaseline, searchPatients]);
 
   // --- Review Discharge ---
   const handleStartReview = (pid: string, patient: Patient) => {
@@ -398,6 +390,8 @@ export default function DoctorPage() {
       const changes: Partial<Patient> = { discharge_papers: papers };
       api.updatePatient(pid, changes);
       updatePatient(pid, changes);
+      const p = patients.find((pt) => pt.pid === pid);
+      if (p) api.prerenderPaperworkPdf(pid, p.name, papers);
     }
     dischargePatient(pid);
     setReviewingPid(null);
@@ -737,9 +731,20 @@ export default function DoctorPage() {
 
                 {/* Discharge Papers */}
                 <div className="rounded-lg border border-gray-200 bg-gray-50/80 p-4">
-                  <span className="text-[11px] font-mono font-semibold text-muted-foreground/40 uppercase tracking-wider block mb-2">
-                    Discharge Papers
-                  </span>
+                  <div className="flex items-center justify-between mb-2">
+                    <span className="text-[11px] font-mono font-semibold text-muted-foreground/40 uppercase tracking-wider">
+                      Discharge Papers
+                    </span>
+                    {selectedPatient.status === "done" && selectedPatient.discharge_papers && (
+                      <button
+                        type="button"
+                        onClick={() => api.openPaperworkPdf(selectedPatient)}
+                        className="text-[11px] font-mono font-medium text-emerald-600 hover:text-emerald-700 uppercase tracking-wider"
+                      >
+                        Print PDF
+                      </button>
+                    )}
+                  </div>
                   {selectedPatient.discharge_papers && Object.keys(selectedPatient.discharge_papers).length > 0 ? (
                     <div className="space-y-3">
                       {Object.entries(selectedPatient.discharge_papers).map(([key, val]) => (
@@ -3,6 +3,7 @@
 import { useState, useMemo, useEffect } from "react";
 import { Patient } from "@/lib/types";
 import * as api from "@/lib/api";
+import { searchRank } from "@/lib/search-index";
 import { usePatientContext } from "@/context/PatientContext";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
@@ -272,7 +273,7 @@ const COLOR_BORDER: Record<string, string> = {
 };
 
 export function SidebarDoctor() {
-  const { patients, updatePatient, dischargePatient, acknowledgeLab, eventLog, simState } = usePatientContext();
+  const { patients, updatePatient, dischargePatient, acknowledgeLab, eventLog, simState, searchPatients } = usePatientContext();
 
   const [search, setSearch] = useState("");
   const [selectedPid, setSelectedPid] = useState<string | null>(null);
@@ -317,14 +318,14 @@ export function SidebarDoctor() {
     if (!search.trim()) return [];
     const q = search.toLowerCase();
     const inboxPids = new Set(inboxItems.map((item) => item.patient.pid));
-    return patients.filter(
-      (p) => p.status === "er_bed" && !inboxPids.has(p.pid) && (
-        p.name.toLowerCase().includes(q) ||
-        (p.chief_complaint ?? "").toLowerCase().includes(q) ||
-        String(p.bed_number ?? "").includes(q)
+    const scores = new Map(searchPatients(search, patients.length).map((r) => [r.pid, r.score]));
+    return patients
+      .filter(
+        (p) => p.status === "er_bed" && !inboxPids.has(p.pid) &&
+          (scores.has(p.pid) || String(p.bed_number ?? "").includes(q))
       )
-    );
-  }, [patients, search, inboxItems]);
+      .sort((a, b) => searchRank(b, q, scores) - searchRank(a, q, scores));
+  }, [patients, search, inboxItems, searchPatients]);
 
   const selectedItem = selectedPid ? inboxItems.find((item) => item.patient.pid === selectedPid) : null;
   const selectedPatient = selectedItem?.patient
@@ -364,6 +365,8 @@ export function SidebarDoctor() {
       const changes: Partial<Patient> = { discharge_papers: papers };
       api.updatePatient(pid, changes);
       updatePatient(pid, changes);
+      const p = patients.find((pt) => pt.pid === pid);
+      if (p) api.prerenderPaperworkPdf(pid, p.name, papers);
     }
     dischargePatient(pid);
     setSelectedPid(null);
@@ -6,6 +6,7 @@ import { usePatients } from "@/hooks/usePatients";
 import { useSimulation } from "@/hooks/useSimulation";
 import { useWebSocket } from "@/hooks/useWebSocket";
 import { injectPatient, stopSim } from "@/lib/api";
+import { PatientSearchIndex, SearchResult } from "@/lib/search-index";
 
 function findNextAvailableBed(patients: Patient[]): number | null {
   const occupied = new Set(
@@ -63,6 +64,8 @@ interface PatientContextValue {
   baselineGroundTruth: Map<string, Patient>;
   baselineScores: BaselineScore[];
   recordBaselineScore: (pid: string, formType: "intake" | "discharge", score: number, max: number) => void;
+  /** Ranked full-text search over charts, labs, notes and paperwork */
+  searchPatients: (query: string, limit?: number) => SearchResult[];
 }
 
 const PatientContext = createContext<PatientContextValue | null>(null);
@@ -446,6 +449,13 @@ export function PatientProvider({ children }: { children: ReactNode }) {
     return () => clearInterval(interval);
   }, [patientHook, addLogEntry]);
 
+  // Full-text search: the index is synced on query, re-indexing only patients whose version changed
+  const searchIndex = useRef(new PatientSearchIndex());
+  const searchPatients = useCallback((query: string, limit?: number) => {
+    searchIndex.current.sync(patientsRef.current);
+    return searchIndex.current.search(query, limit);
+  }, []);
+
   // Compute which waiting room patient is overdue (max 1) — empty in baseline
   const overdueWaitPids = useMemo(() => {
     if (appMode === "baseline") return new Set<string>();
@@ -517,6 +527,7 @@ export function PatientProvider({ children }: { children: ReactNode }) {
     baselineGroundTruth,
     baselineScores,
     recordBaselineScore,
+    searchPatients,
   };
 
   return (
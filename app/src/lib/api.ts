@@ -149,3 +149,60 @@ export async function processRejection(
     };
   }
 }
+
+// --- Discharge paperwork PDF ---
+
+export function paperworkPdfUrl(pid: string): string {
+  return `/api/discharge/${pid}/paperwork.pdf`;
+}
+
+// Renders on the server (cached by content), so this works for any patient with papers
+async function postPaperwork(
+  pid: string,
+  name: string,
+  papers: Record<string, string>,
+  prerender: boolean
+): Promise<Response | null> {
+  const url = `${paperworkPdfUrl(pid)}${prerender ? "?prerender=1" : ""}`;
+  return tryFetch(url, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ name, discharge_papers: papers }),
+  });
+}
+
+// Warms the server-side render cache so printing later is instant (server replies 204, no PDF)
+export async function prerenderPaperworkPdf(
+  pid: string,
+  name: string,
+  papers: Record<string, string>
+): Promise<boolean> {
+  return (await postPaperwork(pid, name, papers, true)) !== null;
+}
+
+// Opens the PDF in a new tab, or downloads it if the popup is blocked.
+// Never navigates this tab: all patient and sim state lives in memory here.
+export async function openPaperworkPdf(patient: Patient): Promise<boolean> {
+  if (!patient.discharge_papers) return false;
+  // Opened before the request so popup blockers treat it as part of the click
+  const win = window.open("", "_blank");
+  const res = await postPaperwork(patient.pid, patient.name, patient.discharge_papers, false);
+  if (!res) {
+    win?.close();
+    return false;
+  }
+  const url = URL.createObjectURL(await res.blob());
+  if (win) {
+    win.location.href = url;
+  } else {
+    const a = document.createElement("a");
+    a.href = url;
+    a.download = `discharge-${patient.pid}.pdf`;
+    document.body.appendChild(a);
+    a.click();
+    a.remove();
+  }
+  // Give the new tab time to load the PDF before releasing it
+  setTimeout(() => URL.revokeObjectURL(url), 60_000);
+  return true;
+}
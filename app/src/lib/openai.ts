@@ -0,0 +1,27 @@
+// Shared, lazily-constructed OpenAI client for the API routes
+// The SDK is imported on first use, so a cold server can answer requests that
+// never reach GPT-4o without paying for the import.
+// This client is the only server-side state worth warming: prompts are built from string
+// literals per request, and the patient snapshot lives in the browser, not on the server.
+
+import type OpenAI from "openai";
+
+let clientPromise: Promise<OpenAI> | null = null;
+
+export function getOpenAI(): Promise<OpenAI> {
+  if (!clientPromise) {
+    clientPromise = import("openai")
+      .then(({ default: OpenAI }) => new OpenAI({ apiKey: process.env.OPENAI_API_KEY ?? "" }))
+      .catch((err) => {
+        // Let the next caller retry instead of caching the failure
+        clientPromise = null;
+        throw err;
+      });
+  }
+  return clientPromise;
+}
+
+/** Start loading the SDK in the background. Cheap to call repeatedly. */
+export function warmOpenAI(): void {
+  getOpenAI().catch(() => {});
+}
@@ -0,0 +1,135 @@
+// Minimal PDF writer for discharge paperwork
+// Renders the SOAP note, AVS and work/school form as plain-text pages using the
+// built-in Helvetica fonts, so no PDF dependency is needed on the server.
+
+export const PAPERWORK_DOCUMENTS: { key: string; title: string }[] = [
+  { key: "soap_note", title: "SOAP Note" },
+  { key: "avs", title: "After Visit Summary" },
+  { key: "work_school_form", title: "Work / School Form" },
+];
+
+const PAGE_WIDTH = 612; // US Letter, in points
+const PAGE_HEIGHT = 792;
+const MARGIN = 54;
+const BODY_SIZE = 10;
+const TITLE_SIZE = 14;
+const LEADING = 13;
+// Wrapping is by character count, assuming ~0.53em per glyph (typical mixed-case Helvetica text).
+// Runs of wide glyphs (all caps, W/M) and long bold titles can still run past the right margin.
+const CHARS_PER_LINE = Math.floor((PAGE_WIDTH - 2 * MARGIN) / (BODY_SIZE * 0.53));
+const LINES_PER_PAGE = Math.floor((PAGE_HEIGHT - 2 * MARGIN - 2 * LEADING) / LEADING);
+
+// WinAnsiEncoding octal codes for characters outside Latin-1 that our templates use
+const WIN_ANSI: Record<string, string> = {
+  "—": "\\227",
+  "–": "\\226",
+  "×": "\\327",
+  "•": "\\225",
+  "‘": "\\221",
+  "’": "\\222",
+  "“": "\\223",
+  "”": "\\224",
+  "°": "\\260",
+};
+
+function escapePdfText(text: string): string {
+  let out = "";
+  for (const ch of text) {
+    if (ch === "\\" || ch === "(" || ch === ")") out += "\\" + ch;
+    else if (WIN_ANSI[ch]) out += WIN_ANSI[ch];
+    else if (ch >= " " && ch <= "~") out += ch;
+    // Latin-1 (José, Müller) maps 1:1 onto WinAnsiEncoding
+    else if (ch >= "\u00a0" && ch <= "\u00ff") out += "\\" + ch.charCodeAt(0).toString(8);
+    else out += "?";
+  }
+  return out;
+}
+
+function wrapText(text: string): string[] {
+  const lines: string[] = [];
+  for (const paragraph of text.split(/\r?\n/)) {
+    let line = "";
+    for (const word of paragraph.split(/\s+/).filter(Boolean)) {
+      if (line && line.length + 1 + word.length > CHARS_PER_LINE) {
+        lines.push(line);
+        line = "";
+      }
+      // Hard-break words longer than a full line
+      let rest = word;
+      while (rest.length > CHARS_PER_LINE) {
+        lines.push(rest.slice(0, CHARS_PER_LINE));
+        rest = rest.slice(CHARS_PER_LINE);
+      }
+      line = line ? `${line} ${rest}` : rest;
+    }
+    lines.push(line);
+  }
+  return lines;
+}
+
+function pageStream(title: string, lines: string[]): string {
+  const top = PAGE_HEIGHT - MARGIN;
+  const ops = [
+    "BT",
+    `/F2 ${TITLE_SIZE} Tf`,
+    `${MARGIN} ${top} Td`,
+    `(${escapePdfText(title)}) Tj`,
+    `/F1 ${BODY_SIZE} Tf`,
+    `${LEADING} TL`,
+    `0 ${-2 * LEADING} Td`,
+  ];
+  for (const line of lines) {
+    ops.push(`(${escapePdfText(line)}) Tj`, "T*");
+  }
+  ops.push("ET");
+  return ops.join("\n");
+}
+
+/**
+ * Render discharge paperwork to a PDF document.
+ * Each document starts on a new page; long documents continue onto further pages.
+ * Documents missing from `papers` are rendered as "Not provided".
+ * The result is pure 7-bit ASCII, so it can be sent as a response body as-is.
+ */
+export function renderPaperworkPdf(patientName: string, papers: Record<string, string>): string {
+  const pages: string[] = [];
+  for (const { key, title } of PAPERWORK_DOCUMENTS) {
+    const body = (papers[key] ?? "").trim() || "Not provided.";
+    const lines = wrapText(body);
+    const heading = `${title} — ${patientName}`;
+    for (let i = 0; i < lines.length; i += LINES_PER_PAGE) {
+      pages.push(pageStream(i === 0 ? heading : `${heading} (cont.)`, lines.slice(i, i + LINES_PER_PAGE)));
+    }
+  }
+
+  // Object layout: 1 catalog, 2 page tree, 3-4 fonts, then (page, content) pairs
+  const objects: string[] = [];
+  const pageIds = pages.map((_, i) => 5 + i * 2);
+  objects.push("<< /Type /Catalog /Pages 2 0 R >>");
+  objects.push(`<< /Type /Pages /Kids [${pageIds.map((id) => `${id} 0 R`).join(" ")}] /Count ${pages.length} >>`);
+  objects.push("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>");
+  objects.push("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>");
+  pages.forEach((stream, i) => {
+    objects.push(
+      `<< /Type /Page /Parent 2 0 R /MediaBox [0 0 ${PAGE_WIDTH} ${PAGE_HEIGHT}] ` +
+        `/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents ${pageIds[i] + 1} 0 R >>`
+    );
+    objects.push(`<< /Length ${stream.length} >>\nstream\n${stream}\nendstream`);
+  });
+
+  // Every object is 7-bit ASCII, so string offsets are byte offsets
+  let pdf = "%PDF-1.4\n";
+  const offsets: number[] = [];
+  objects.forEach((body, i) => {
+    offsets.push(pdf.length);
+    pdf += `${i + 1} 0 obj\n${body}\nendobj\n`;
+  });
+  const xrefOffset = pdf.length;
+  pdf += `xref\n0 ${objects.length + 1}\n0000000000 65535 f \n`;
+  for (const offset of offsets) {
+    pdf += `${String(offset).padStart(10, "0")} 00000 n \n`;
+  }
+  pdf += `trailer\n<< /Size ${objects.length + 1} /Root 1 0 R >>\nstartxref\n${xrefOffset}\n%%EOF\n`;
+
+  return pdf;
+}
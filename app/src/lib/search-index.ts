@@ -0,0 +1,235 @@
+// In-memory inverted index over patient charts and paperwork
+// Updated incrementally: a patient is only re-tokenized when its version changes.
+
+import { Patient } from "./types";
+
+export interface SearchResult {
+  pid: string;
+  score: number;
+}
+
+interface Posting {
+  positions: number[];
+  weight: number; // sum of field weights over all occurrences
+}
+
+interface IndexedDoc {
+  version: number;
+  length: number;
+  terms: Map<string, Posting>;
+}
+
+// Positions jump by this much between fields so phrases never match across fields
+const FIELD_GAP = 1000;
+// Prefix matches count for less than exact term matches
+const PREFIX_FACTOR = 0.5;
+
+function patientFields(p: Patient): [text: string, weight: number][] {
+  const fields: [string, number][] = [
+    [p.name, 3],
+    [p.chief_complaint ?? "", 2],
+    [p.primary_diagnoses ?? "", 2],
+    [p.hpi ?? "", 1],
+    [p.triage_notes ?? "", 1],
+  ];
+  for (const note of p.doctor_notes ?? []) fields.push([note, 1]);
+  for (const note of p.rejection_notes ?? []) fields.push([note, 1]);
+  for (const lab of p.lab_results ?? []) fields.push([`${lab.test} ${lab.result}`, 1.5]);
+  for (const text of Object.values(p.discharge_papers ?? {})) fields.push([text, 0.5]);
+  return fields;
+}
+
+/**
+ * Sort key for search results. The patient in the bed a numeric query names always comes
+ * first, since "4" also prefix-matches ages, lab values and the like.
+ */
+export function searchRank(p: Patient, query: string, scores: Map<string, number>): number {
+  const q = query.trim();
+  if (/^\d+$/.test(q) && p.bed_number === Number(q)) return Number.MAX_VALUE;
+  return scores.get(p.pid) ?? 0;
+}
+
+export function tokenize(text: string): string[] {
+  return text.toLowerCase().split(/[^a-z0-9]+/).filter(Boolean);
+}
+
+function lowerBound(arr: string[], target: string): number {
+  let lo = 0;
+  let hi = arr.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (arr[mid] < target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+export class PatientSearchIndex {
+  private docs = new Map<string, IndexedDoc>();
+  // term → pids containing it
+  private postings = new Map<string, Set<string>>();
+  // All indexed terms, kept sorted for prefix range scans
+  private sortedTerms: string[] = [];
+  private totalLength = 0;
+
+  get size(): number {
+    return this.docs.size;
+  }
+
+  /** Index or re-index a patient. No-op if this version is already indexed. */
+  upsert(p: Patient): void {
+    const existing = this.docs.get(p.pid);
+    if (existing && existing.version === p.version) return;
+    if (existing) this.remove(p.pid);
+
+    const terms = new Map<string, Posting>();
+    let position = 0;
+    let length = 0;
+    for (const [text, weight] of patientFields(p)) {
+      for (const term of tokenize(text)) {
+        let posting = terms.get(term);
+        if (!posting) {
+          posting = { positions: [], weight: 0 };
+          terms.set(term, posting);
+        }
+        posting.positions.push(position++);
+        posting.weight += weight;
+        length++;
+      }
+      position += FIELD_GAP;
+    }
+
+    for (const term of terms.keys()) {
+      let pids = this.postings.get(term);
+      if (!pids) {
+        pids = new Set();
+        this.postings.set(term, pids);
+        this.sortedTerms.splice(lowerBound(this.sortedTerms, term), 0, term);
+      }
+      pids.add(p.pid);
+    }
+    this.docs.set(p.pid, { version: p.version, length, terms });
+    this.totalLength += length;
+  }
+
+  remove(pid: string): void {
+    const doc = this.docs.get(pid);
+    if (!doc) return;
+    for (const term of doc.terms.keys()) {
+      const pids = this.postings.get(term);
+      if (!pids) continue;
+      pids.delete(pid);
+      if (pids.size === 0) {
+        this.postings.delete(term);
+        this.sortedTerms.splice(lowerBound(this.sortedTerms, term), 1);
+      }
+    }
+    this.docs.delete(pid);
+    this.totalLength -= doc.length;
+  }
+
+  /** Bring the index in line with the current patient list, touching only changed patients. */
+  sync(patients: Patient[]): void {
+    const seen = new Set<string>();
+    for (const p of patients) {
+      seen.add(p.pid);
+      this.upsert(p);
+    }
+    if (seen.size === this.docs.size) return;
+    for (const pid of [...this.docs.keys()]) {
+      if (!seen.has(pid)) this.remove(pid);
+    }
+  }
+
+  /**
+   * Ranked search. Bare words match as prefixes ("appen" finds "appendicitis");
+   * quoted text must appear as an exact phrase. All clauses must match.
+   */
+  search(query: string, limit = 20): SearchResult[] {
+    const clauses: { phrase: string[] | null; term: string }[] = [];
+    for (const match of query.matchAll(/"([^"]*)"|(\S+)/g)) {
+      if (match[1] !== undefined) {
+        const phrase = tokenize(match[1]);
+        if (phrase.length === 1) clauses.push({ phrase: null, term: phrase[0] });
+        else if (phrase.length > 1) clauses.push({ phrase, term: "" });
+      } else {
+        for (const term of tokenize(match[2])) clauses.push({ phrase: null, term });
+      }
+    }
+    if (clauses.length === 0 || this.docs.size === 0) return [];
+
+    let scores: Map<string, number> | null = null;
+    for (const clause of clauses) {
+      const clauseScores = clause.phrase
+        ? this.scorePhrase(clause.phrase)
+        : this.scorePrefix(clause.term);
+      if (scores === null) {
+        scores = clauseScores;
+      } else {
+        const next = new Map<string, number>();
+        for (const [pid, score] of scores) {
+          const add = clauseScores.get(pid);
+          if (add !== undefined) next.set(pid, score + add);
+        }
+        scores = next;
+      }
+      if (scores.size === 0) return [];
+    }
+
+    return [...scores!]
+      .map(([pid, score]) => ({ pid, score }))
+      .sort((a, b) => b.score - a.score)
+      .slice(0, limit);
+  }
+
+  private idf(docFreq: number): number {
+    return Math.log(1 + (this.docs.size - docFreq + 0.5) / (docFreq + 0.5));
+  }
+
+  // BM25-style saturation over the weighted term frequency
+  private termScore(doc: IndexedDoc, weight: number, idf: number): number {
+    const avgLength = this.totalLength / this.docs.size || 1;
+    const k1 = 1.2;
+    const b = 0.75;
+    return (idf * weight * (k1 + 1)) / (weight + k1 * (1 - b + (b * doc.length) / avgLength));
+  }
+
+  private scorePrefix(prefix: string): Map<string, number> {
+    const scores = new Map<string, number>();
+    for (let i = lowerBound(this.sortedTerms, prefix); i < this.sortedTerms.length; i++) {
+      const term = this.sortedTerms[i];
+      if (!term.startsWith(prefix)) break;
+      const pids = this.postings.get(term)!;
+      const idf = this.idf(pids.size);
+      const factor = term === prefix ? 1 : PREFIX_FACTOR;
+      for (const pid of pids) {
+        const doc = this.docs.get(pid)!;
+        const score = this.termScore(doc, doc.terms.get(term)!.weight, idf) * factor;
+        // A document matching several expansions keeps its best one
+        scores.set(pid, Math.max(scores.get(pid) ?? 0, score));
+      }
+    }
+    return scores;
+  }
+
+  private scorePhrase(phrase: string[]): Map<string, number> {
+    const scores = new Map<string, number>();
+    const candidateSets = phrase.map((term) => this.postings.get(term));
+    if (candidateSets.some((s) => !s)) return scores;
+    const rarest = candidateSets.reduce((a, b) => (a!.size <= b!.size ? a : b))!;
+    const idf = phrase.reduce((sum, term) => sum + this.idf(this.postings.get(term)!.size), 0);
+
+    for (const pid of rarest) {
+      const doc = this.docs.get(pid)!;
+      const postings = phrase.map((term) => doc.terms.get(term));
+      if (postings.some((p) => !p)) continue;
+      const following = postings.slice(1).map((p) => new Set(p!.positions));
+      let hits = 0;
+      for (const start of postings[0]!.positions) {
+        if (following.every((positions, i) => positions.has(start + i + 1))) hits++;
+      }
+      if (hits > 0) scores.set(pid, this.termScore(doc, hits, idf));
+    }
+    return scores;
+  }
+}